@@ -0,0 +1,33 @@
+"""Compiled numeric kernels for the analyzer agent."""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def numeric_stats(values):
+    """
+    Compute min, max and mean of a numeric array in a single pass.
+
+    Args:
+        values: Non-empty 1-D numeric array
+
+    Returns:
+        Tuple of (min, max, mean)
+    """
+    low = values[0]
+    high = values[0]
+    total = 0.0
+    for i in range(values.shape[0]):
+        value = values[i]
+        total += value
+        if value < low:
+            low = value
+        elif value > high:
+            high = value
+    return low, high, total / values.shape[0]
+
+
+# Compile the common signatures up front so the first task doesn't pay for it
+numeric_stats(np.zeros(1, dtype=np.int64))
+numeric_stats(np.zeros(1, dtype=np.float64))
@@ -1,15 +1,128 @@
 """Analyzer agent - Extracts insights and patterns from data."""
 
-import asyncio
 import logging
-from collections import Counter
-from typing import Any, Dict, List, Optional
+import sys
+from collections import Counter, deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 
 from agents.base_agent import BaseAgent
 from communication.message_bus import MessageBus
 
 logger = logging.getLogger(__name__)
 
+# Lists shorter than this use the builtins; below it the array conversion
+# costs more than the compiled kernel saves
+_KERNEL_THRESHOLD = 512
+
+# numpy and the compiled kernels, loaded on first use by _get_kernels
+np = None
+_kernels = None
+_kernels_loaded = False
+
+# Visualization flags collected by _create_visualizations
+_VIZ_BAR = 1
+_VIZ_LINE = 2
+_VIZ_PIE = 4
+
+
+def _get_kernels():
+    """
+    Import numpy and the compiled kernels on first use.
+
+    Keeps numba's import and JIT start-up cost off agent start-up.
+
+    Returns:
+        The kernels module, or None if numpy/numba are not installed
+    """
+    global np, _kernels, _kernels_loaded
+
+    if not _kernels_loaded:
+        _kernels_loaded = True
+        try:
+            import numpy
+
+            from agents.analyzer import _kernels as kernels
+        except ImportError:  # numpy/numba are optional; fall back to builtins
+            pass
+        else:
+            np = numpy
+            _kernels = kernels
+
+    return _kernels
+
+
+def _numeric_stats(data: List[Any], compiled: bool = True) -> Dict[str, Any]:
+    """
+    Compute min/max/avg for a non-empty list of numbers.
+
+    Uses the compiled kernel for large lists when it is available and the
+    list converts to a plain numeric array; otherwise uses the builtins.
+
+    Args:
+        data: Numeric values
+        compiled: Whether the compiled kernel may be used
+
+    Returns:
+        Dictionary with min, max and avg
+    """
+    if compiled and len(data) >= _KERNEL_THRESHOLD and _get_kernels() is not None:
+        values = np.asarray(data)
+        if values.ndim == 1 and values.dtype.kind in "iuf":
+            low, high, avg = _kernels.numeric_stats(values)
+            return {"min": low, "max": high, "avg": avg}
+
+    return {
+        "min": min(data),
+        "max": max(data),
+        "avg": sum(data) / len(data)
+    }
+
+
+def _fmt_bytes(size_bytes: int) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Human-readable size
+    """
+    if size_bytes < 1024:
+        return f"{size_bytes} bytes"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    else:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
+def _profile_list(data: List[Any]) -> Dict[str, Any]:
+    """
+    Profile a list once so the analysis helpers don't each rescan it.
+
+    Args:
+        data: List to profile
+
+    Returns:
+        Dictionary with type_counts (type name -> count), is_numeric and,
+        for numeric lists, numeric_stats
+    """
+    type_counts = Counter(map(type, data))
+    is_numeric = bool(data) and all(issubclass(t, (int, float)) for t in type_counts)
+
+    name_counts = Counter()
+    for item_type, count in type_counts.items():
+        name_counts[item_type.__name__] += count
+
+    profile = {"type_counts": dict(name_counts), "is_numeric": is_numeric}
+    if is_numeric:
+        # Mixed int/float lists use the builtins so min/max keep their types
+        profile["numeric_stats"] = _numeric_stats(data, compiled=len(type_counts) == 1)
+
+    return profile
+
 
 class AnalyzerAgent(BaseAgent):
     """
@@ -19,6 +132,9 @@ class AnalyzerAgent(BaseAgent):
     and generating visualizations.
     """
 
+    # Maximum number of entries kept in analysis_history
+    HISTORY_MAX = 1000
+
     def __init__(self, message_bus: MessageBus, agent_id: str = "analyzer_agent"):
         """
         Initialize analyzer agent.
@@ -32,7 +148,7 @@ class AnalyzerAgent(BaseAgent):
             message_bus=message_bus,
             capabilities=["analysis", "pattern_detection", "statistics", "visualization"]
         )
-        self.analysis_history: List[Dict[str, Any]] = []
+        self.analysis_history: Deque[Dict[str, Any]] = deque(maxlen=self.HISTORY_MAX)
 
     async def process_task(self, task_data: Dict[str, Any]) -> Any:
         """
@@ -47,34 +163,32 @@ class AnalyzerAgent(BaseAgent):
         description = task_data.get("description", "")
         parameters = task_data.get("parameters", {})
         data = parameters.get("data", {})
+        agent_id = self.agent_id
 
-        logger.info(f"Analyzer agent processing: {description}")
+        logger.info("Analyzer agent processing: %s", description)
 
-        # Extract insights
-        insights = self._extract_insights(data)
+        # Profile list data once for the helpers below
+        profile = _profile_list(data) if isinstance(data, list) else None
 
-        # Detect patterns
-        patterns = self._detect_patterns(data)
-
-        # Generate statistics
-        statistics = self._generate_statistics(data)
-
-        # Create visualization metadata
-        visualizations = self._create_visualizations(insights, patterns)
+        # Extract insights, detect patterns and generate statistics
+        insights = self._extract_insights(data)
+        patterns = self._detect_patterns(data, profile)
 
         result = {
             "insights": insights,
             "patterns": patterns,
-            "statistics": statistics,
-            "visualizations": visualizations,
+            "statistics": self._generate_statistics(data, profile),
+            "visualizations": self._create_visualizations(insights, patterns),
             "data_summary": self._summarize_data(data),
-            "agent": self.agent_id
+            "agent": agent_id
         }
 
-        # Store in history
+        # Store a summary in history rather than the full result
         self.analysis_history.append({
             "task": description,
-            "result": result
+            "agent": agent_id,
+            "insight_count": len(insights),
+            "timestamp": datetime.now()
         })
 
         return result
@@ -134,12 +248,17 @@ class AnalyzerAgent(BaseAgent):
 
         return insights
 
-    def _detect_patterns(self, data: Any) -> List[Dict[str, Any]]:
+    def _detect_patterns(
+        self,
+        data: Any,
+        profile: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Detect patterns in data.
 
         Args:
             data: Data to analyze
+            profile: Precomputed list profile (see _profile_list)
 
         Returns:
             List of detected patterns
@@ -153,7 +272,8 @@ class AnalyzerAgent(BaseAgent):
                 patterns.append({
                     "type": "structure",
                     "description": f"Dictionary with {len(keys)} keys",
-                    "details": f"Key patterns: {', '.join(keys[:5])}"
+                    "details": f"Key patterns: {', '.join(keys[:5])}",
+                    "has_counts": any("count" in key.lower() for key in keys[:5])
                 })
 
             # Check for nested data
@@ -167,30 +287,38 @@ class AnalyzerAgent(BaseAgent):
 
         elif isinstance(data, list):
             if data:
+                if profile is None:
+                    profile = _profile_list(data)
+
                 # Check data types
-                type_counts = Counter(type(item).__name__ for item in data)
                 patterns.append({
                     "type": "data_types",
                     "description": "Data type distribution",
-                    "details": dict(type_counts)
+                    "details": profile["type_counts"]
                 })
 
                 # Check for sequences
-                if all(isinstance(item, (int, float)) for item in data):
+                if profile["is_numeric"]:
+                    numeric_stats = profile["numeric_stats"]
                     patterns.append({
                         "type": "numeric_sequence",
                         "description": "Numeric data sequence",
-                        "details": f"Range: {min(data)} to {max(data)}"
+                        "details": f"Range: {numeric_stats['min']} to {numeric_stats['max']}"
                     })
 
         return patterns
 
-    def _generate_statistics(self, data: Any) -> Dict[str, Any]:
+    def _generate_statistics(
+        self,
+        data: Any,
+        profile: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Generate statistical summary.
 
         Args:
             data: Data to analyze
+            profile: Precomputed list profile (see _profile_list)
 
         Returns:
             Statistical summary
@@ -206,12 +334,10 @@ class AnalyzerAgent(BaseAgent):
 
         elif isinstance(data, list):
             stats["item_count"] = len(data)
-            if data and all(isinstance(item, (int, float)) for item in data):
-                stats["numeric_stats"] = {
-                    "min": min(data),
-                    "max": max(data),
-                    "avg": sum(data) / len(data)
-                }
+            if profile is None:
+                profile = _profile_list(data)
+            if profile["is_numeric"]:
+                stats["numeric_stats"] = profile["numeric_stats"]
 
         return stats
 
@@ -232,8 +358,19 @@ class AnalyzerAgent(BaseAgent):
         """
         visualizations = []
 
+        # Tag applicable chart types in a single pass over the patterns
+        flags = 0
+        for pattern in patterns:
+            pattern_type = pattern.get("type")
+            if pattern_type == "numeric_sequence":
+                flags |= _VIZ_LINE
+            elif pattern_type == "data_types":
+                flags |= _VIZ_PIE
+            elif pattern_type == "structure" and pattern["has_counts"]:
+                flags |= _VIZ_BAR
+
         # Suggest bar chart for counts
-        if any("count" in str(p).lower() for p in patterns):
+        if flags & _VIZ_BAR:
             visualizations.append({
                 "type": "bar_chart",
                 "title": "Data Distribution",
@@ -241,7 +378,7 @@ class AnalyzerAgent(BaseAgent):
             })
 
         # Suggest line chart for sequences
-        if any(p.get("type") == "numeric_sequence" for p in patterns):
+        if flags & _VIZ_LINE:
             visualizations.append({
                 "type": "line_chart",
                 "title": "Trend Analysis",
@@ -249,7 +386,7 @@ class AnalyzerAgent(BaseAgent):
             })
 
         # Suggest pie chart for distributions
-        if any(p.get("type") == "data_types" for p in patterns):
+        if flags & _VIZ_PIE:
             visualizations.append({
                 "type": "pie_chart",
                 "title": "Type Distribution",
@@ -287,29 +424,34 @@ class AnalyzerAgent(BaseAgent):
 
     def _count_data_items(self, data: Any, depth: int = 0, max_depth: int = 3) -> int:
         """
-        Recursively count data items.
+        Count data items in nested dicts and lists.
+
+        Walks the structure iteratively rather than recursing.
 
         Args:
             data: Data to count
-            depth: Current recursion depth
-            max_depth: Maximum recursion depth
+            depth: Depth of data within the overall structure
+            max_depth: Maximum depth to descend to
 
         Returns:
             Total count of items
         """
-        if depth > max_depth:
-            return 0
-
         count = 0
-
-        if isinstance(data, dict):
-            count += len(data)
-            for value in data.values():
-                count += self._count_data_items(value, depth + 1, max_depth)
-        elif isinstance(data, list):
-            count += len(data)
-            for item in data:
-                count += self._count_data_items(item, depth + 1, max_depth)
+        stack = deque([(data, depth)])
+
+        while stack:
+            obj, level = stack.pop()
+            if level > max_depth:
+                continue
+
+            if isinstance(obj, dict):
+                count += len(obj)
+                if level < max_depth:
+                    stack.extend((value, level + 1) for value in obj.values())
+            elif isinstance(obj, list):
+                count += len(obj)
+                if level < max_depth:
+                    stack.extend((item, level + 1) for item in obj)
 
         return count
 
@@ -323,16 +465,7 @@ class AnalyzerAgent(BaseAgent):
         Returns:
             Size description
         """
-        import sys
-
-        size_bytes = sys.getsizeof(data)
-
-        if size_bytes < 1024:
-            return f"{size_bytes} bytes"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
+        return _fmt_bytes(sys.getsizeof(data))
 
     async def analyze_trends(self, data: List[Any]) -> Dict[str, Any]:
         """
@@ -360,9 +493,9 @@ class AnalyzerAgent(BaseAgent):
             limit: Maximum number of entries to return
 
         Returns:
-            Analysis history
+            Analysis history summaries, oldest first
         """
         history = self.analysis_history
         if limit:
-            history = history[-limit:]
-        return history
+            return list(islice(history, max(0, len(history) - limit), None))
+        return list(history)
@@ -1,16 +1,21 @@
 """Base agent class for all agent implementations."""
 
 import asyncio
+import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from communication.message import Message, MessageType
 from communication.message_bus import MessageBus
-from communication.protocol import AgentStatus, Protocol, Task
+from communication.protocol import AgentStatus
 
 logger = logging.getLogger(__name__)
 
+# Posted to an agent's inbox by stop() to wake and end its message loop
+_SHUTDOWN = object()
+
 
 class BaseAgent(ABC):
     """
@@ -20,6 +25,20 @@ class BaseAgent(ABC):
     and lifecycle management.
     """
 
+    # Seconds stop() waits for the message loop to exit before cancelling it
+    STOP_TIMEOUT = 1.0
+
+    # Maximum number of entries kept by _cache_put
+    RESULT_CACHE_SIZE = 256
+
+    # Message type -> handler method name; other types go to handle_message
+    _DISPATCH = {
+        MessageType.TASK: "_handle_task_message",
+        MessageType.REQUEST: "_handle_request_message",
+        MessageType.STATUS: "handle_message",
+        MessageType.BROADCAST: "handle_message",
+    }
+
     def __init__(
         self,
         agent_id: str,
@@ -42,39 +61,142 @@ class BaseAgent(ABC):
         self.state = "idle"
         self.current_task: Optional[str] = None
         self.running = False
+        self.pending_futures: Dict[str, asyncio.Future] = {}  # task_id -> awaited RESULT
+        self._work_queue: asyncio.Queue = asyncio.Queue()
+        self._result_cache: OrderedDict = OrderedDict()
+        self._dispatch_task: Optional[asyncio.Task] = None
         self._process_task: Optional[asyncio.Task] = None
 
-        logger.info(f"Initialized {self.__class__.__name__} with ID: {agent_id}")
+        logger.info("Initialized %s with ID: %s", self.__class__.__name__, agent_id)
 
     async def start(self) -> None:
         """Start the agent."""
-        await self.message_bus.register_agent(self.agent_id, self.inbox)
+        await self.message_bus.register_agent(
+            self.agent_id, self.inbox, result_handler=self._resolve_result
+        )
         self.running = True
+        self._dispatch_task = asyncio.create_task(self._dispatch_messages())
         self._process_task = asyncio.create_task(self._process_messages())
-        logger.info(f"Agent {self.agent_id} started")
+        logger.info("Agent %s started", self.agent_id)
 
     async def stop(self) -> None:
         """Stop the agent."""
         self.running = False
-        if self._process_task:
-            self._process_task.cancel()
+        tasks = [task for task in (self._dispatch_task, self._process_task) if task]
+        if tasks:
+            self.inbox.put_nowait(_SHUTDOWN)
             try:
-                await self._process_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(asyncio.gather(*tasks), timeout=self.STOP_TIMEOUT)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass
         await self.message_bus.unregister_agent(self.agent_id)
-        logger.info(f"Agent {self.agent_id} stopped")
+        logger.info("Agent %s stopped", self.agent_id)
+
+    async def _dispatch_messages(self) -> None:
+        """
+        Route messages from the inbox.
+
+        RESULTs that someone is awaiting resolve their future immediately,
+        even while a task handler is running; everything else is queued
+        for _process_messages. Most awaited RESULTs never reach the inbox,
+        as the message bus resolves them directly through _resolve_result.
+        """
+        while True:
+            message = await self.inbox.get()
+            if message is _SHUTDOWN:
+                if not self.running:
+                    self._work_queue.put_nowait(_SHUTDOWN)
+                    break
+                continue  # Stale sentinel left by an earlier stop()
+
+            # One bad message must not end the loop and leave the inbox unread
+            try:
+                if not self._resolve_result(message):
+                    self._work_queue.put_nowait(message)
+            except Exception as e:
+                logger.error("Error dispatching message in %s: %s", self.agent_id, e)
 
     async def _process_messages(self) -> None:
-        """Process incoming messages from inbox."""
-        while self.running:
+        """Process messages routed by _dispatch_messages, one at a time."""
+        while True:
+            message = await self._work_queue.get()
+            if message is _SHUTDOWN:
+                if not self.running:
+                    break
+                continue  # Stale sentinel left by an earlier stop()
+
             try:
-                message = await asyncio.wait_for(self.inbox.get(), timeout=0.5)
                 await self._handle_message(message)
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
-                logger.error(f"Error processing message in {self.agent_id}: {e}")
+                logger.error("Error processing message in %s: %s", self.agent_id, e)
+
+    def _expect_result(self, task_id: str) -> asyncio.Future:
+        """
+        Register a future for the RESULT of a task this agent sent out.
+
+        Register before sending the task so a fast reply can't be missed.
+
+        Args:
+            task_id: ID of the outgoing task
+
+        Returns:
+            Future resolved with the RESULT message
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending_futures[task_id] = future
+        return future
+
+    def _resolve_result(self, message: Message) -> bool:
+        """
+        Resolve the pending future for a RESULT message.
+
+        The future stays in pending_futures; whoever registered it removes it.
+
+        Args:
+            message: Incoming message
+
+        Returns:
+            True if the message completed a pending future
+        """
+        if message.message_type != MessageType.RESULT or not isinstance(message.content, dict):
+            return False
+
+        task_id = message.content.get("task_id")
+        future = self.pending_futures.get(task_id)
+        if future is None or future.done():
+            return False
+
+        future.set_result(message)
+        logger.debug("%s received result for %s", self.agent_id, task_id)
+        return True
+
+    def _cache_get(self, key: Any) -> Optional[Any]:
+        """
+        Look up a cached task result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached result, or None if not cached
+        """
+        if key not in self._result_cache:
+            return None
+        self._result_cache.move_to_end(key)
+        return copy.deepcopy(self._result_cache[key])
+
+    def _cache_put(self, key: Any, result: Any) -> None:
+        """
+        Cache a task result, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            result: Result to cache (a copy is stored)
+        """
+        self._result_cache[key] = copy.deepcopy(result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
     async def _handle_message(self, message: Message) -> None:
         """
@@ -83,21 +205,18 @@ class BaseAgent(ABC):
         Args:
             message: Incoming message
         """
-        logger.debug(f"{self.agent_id} received {message.message_type.value} from {message.from_}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s received %s from %s",
+                self.agent_id, message.message_type, message.from_
+            )
+
+        handler = getattr(self, self._DISPATCH.get(message.message_type, "handle_message"))
 
         try:
-            if message.message_type == MessageType.TASK:
-                await self._handle_task_message(message)
-            elif message.message_type == MessageType.REQUEST:
-                await self._handle_request_message(message)
-            elif message.message_type == MessageType.STATUS:
-                await self._handle_status_message(message)
-            elif message.message_type == MessageType.BROADCAST:
-                await self._handle_broadcast_message(message)
-            else:
-                await self.handle_message(message)
+            await handler(message)
         except Exception as e:
-            logger.error(f"Error handling message in {self.agent_id}: {e}")
+            logger.error("Error handling message in %s: %s", self.agent_id, e)
             await self._send_error(message, str(e))
 
     async def _handle_task_message(self, message: Message) -> None:
@@ -109,7 +228,7 @@ class BaseAgent(ABC):
         try:
             result = await self.process_task(task_data)
 
-            response = Message(
+            await self.message_bus.send_message(Message(
                 to=message.from_,
                 from_=self.agent_id,
                 message_type=MessageType.RESULT,
@@ -119,11 +238,10 @@ class BaseAgent(ABC):
                     "status": "completed"
                 },
                 correlation_id=message.message_id
-            )
-            await self.message_bus.send_message(response)
+            ))
 
         except Exception as e:
-            logger.error(f"Task processing error in {self.agent_id}: {e}")
+            logger.error("Task processing error in %s: %s", self.agent_id, e)
             await self._send_error(message, str(e))
         finally:
             self.state = "idle"
@@ -153,24 +271,15 @@ class BaseAgent(ABC):
             # Pass to subclass
             await self.handle_message(message)
 
-    async def _handle_status_message(self, message: Message) -> None:
-        """Handle status update message."""
-        await self.handle_message(message)
-
-    async def _handle_broadcast_message(self, message: Message) -> None:
-        """Handle broadcast message."""
-        await self.handle_message(message)
-
     async def _send_error(self, original_message: Message, error: str) -> None:
         """Send error response."""
-        error_message = Message(
+        await self.message_bus.send_message(Message(
             to=original_message.from_,
             from_=self.agent_id,
             message_type=MessageType.ERROR,
             content={"error": error, "original_message_id": original_message.message_id},
             correlation_id=original_message.message_id
-        )
-        await self.message_bus.send_message(error_message)
+        ))
 
     async def send_message(
         self,
@@ -232,4 +341,4 @@ class BaseAgent(ABC):
         Args:
             message: Message to handle
         """
-        logger.debug(f"{self.agent_id} ignoring message type: {message.message_type}")
+        logger.debug("%s ignoring message type: %s", self.agent_id, message.message_type)
@@ -2,16 +2,31 @@
 
 import asyncio
 import logging
+import re
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from agents.base_agent import BaseAgent
 from communication.message import Message, MessageType
 from communication.message_bus import MessageBus
-from communication.protocol import AgentCapability, Task, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Keyword patterns used by _decompose, matched as substrings of the
+# lowercased description
+_RESEARCH_KEYWORDS = re.compile("research|gather|find|investigate")
+_ANALYSIS_KEYWORDS = re.compile("analyze|insights|trends|patterns")
+_WRITING_KEYWORDS = re.compile("write|create|report|document")
+
+# Subtask type -> specialist agent ID
+_AGENT_MAPPING = MappingProxyType({
+    "research": "research_agent",
+    "analysis": "analyzer_agent",
+    "writing": "writer_agent",
+    "general": "research_agent"  # Default to research
+})
+
 
 class ManagerAgent(BaseAgent):
     """
@@ -51,13 +66,14 @@ class ManagerAgent(BaseAgent):
         description = task_data.get("description", "")
         parameters = task_data.get("parameters", {})
 
-        logger.info(f"Manager processing task: {description}")
+        logger.info("Manager processing task: %s", description)
 
         # Decompose task into subtasks
         subtasks = self._decompose(description, parameters)
-        logger.info(f"Decomposed into {len(subtasks)} subtasks")
+        logger.info("Decomposed into %d subtasks", len(subtasks))
 
         # Assign subtasks to appropriate agents
+        dispatches = []
         subtask_ids = []
         for subtask in subtasks:
             agent_id = self._select_agent(subtask)
@@ -70,9 +86,19 @@ class ManagerAgent(BaseAgent):
                 "parameters": subtask.get("parameters", {})
             }
 
-            await self.send_message(agent_id, subtask_message, MessageType.TASK)
-            subtask_ids.append(subtask_id)
+            # Register before sending so a fast reply can't race the future
+            self._expect_result(subtask_id)
             self.subtask_mapping[subtask_id] = task_id
+            subtask_ids.append(subtask_id)
+            dispatches.append(Message(
+                to=agent_id,
+                from_=self.agent_id,
+                message_type=MessageType.TASK,
+                content=subtask_message
+            ))
+
+        # Hand the whole fan-out to the bus in one call
+        await self.message_bus.send_batch(dispatches)
 
         # Gather results from all subtasks
         results = await self._gather_results(subtask_ids, timeout=60.0)
@@ -96,9 +122,10 @@ class ManagerAgent(BaseAgent):
         # Simple task decomposition logic
         # In a real system, this would use more sophisticated logic or LLM
         subtasks = []
+        text = description.lower()
 
         # Check if this is a research-heavy task
-        if any(keyword in description.lower() for keyword in ["research", "gather", "find", "investigate"]):
+        if _RESEARCH_KEYWORDS.search(text):
             subtasks.append({
                 "type": "research",
                 "description": f"Research: {description}",
@@ -106,7 +133,7 @@ class ManagerAgent(BaseAgent):
             })
 
         # Check if analysis is needed
-        if any(keyword in description.lower() for keyword in ["analyze", "insights", "trends", "patterns"]):
+        if _ANALYSIS_KEYWORDS.search(text):
             subtasks.append({
                 "type": "analysis",
                 "description": f"Analyze data for: {description}",
@@ -114,7 +141,7 @@ class ManagerAgent(BaseAgent):
             })
 
         # Check if content creation is needed
-        if any(keyword in description.lower() for keyword in ["write", "create", "report", "document"]):
+        if _WRITING_KEYWORDS.search(text):
             subtasks.append({
                 "type": "writing",
                 "description": f"Write content for: {description}",
@@ -141,21 +168,15 @@ class ManagerAgent(BaseAgent):
         Returns:
             Agent ID
         """
-        task_type = subtask["type"]
-
-        agent_mapping = {
-            "research": "research_agent",
-            "analysis": "analyzer_agent",
-            "writing": "writer_agent",
-            "general": "research_agent"  # Default to research
-        }
-
-        return agent_mapping.get(task_type, "research_agent")
+        return _AGENT_MAPPING.get(subtask["type"], "research_agent")
 
     async def _gather_results(self, subtask_ids: List[str], timeout: float = 60.0) -> Dict[str, Any]:
         """
         Gather results from multiple subtasks.
 
+        Waits on the futures registered for each subtask, which the message
+        dispatcher resolves as RESULT messages arrive.
+
         Args:
             subtask_ids: List of subtask IDs to wait for
             timeout: Timeout in seconds
@@ -163,29 +184,28 @@ class ManagerAgent(BaseAgent):
         Returns:
             Dictionary of subtask results
         """
+        futures = {
+            subtask_id: self.pending_futures[subtask_id]
+            for subtask_id in subtask_ids
+            if subtask_id in self.pending_futures
+        }
+
+        if futures:
+            await asyncio.wait(futures.values(), timeout=timeout)
+
         results = {}
-        start_time = asyncio.get_event_loop().time()
         remaining = set(subtask_ids)
 
-        while remaining and (asyncio.get_event_loop().time() - start_time) < timeout:
-            try:
-                # Check inbox for results
-                if not self.inbox.empty():
-                    message = await asyncio.wait_for(self.inbox.get(), timeout=0.5)
-
-                    if message.message_type == MessageType.RESULT:
-                        task_id = message.content.get("task_id")
-                        if task_id in remaining:
-                            results[task_id] = message.content.get("result")
-                            remaining.remove(task_id)
-                            logger.info(f"Received result for subtask {task_id}")
-
-                await asyncio.sleep(0.1)
-            except asyncio.TimeoutError:
-                continue
+        for subtask_id, future in futures.items():
+            self.pending_futures.pop(subtask_id, None)
+            if future.done() and not future.cancelled():
+                results[subtask_id] = future.result().content.get("result")
+                remaining.discard(subtask_id)
+            else:
+                future.cancel()
 
         if remaining:
-            logger.warning(f"Timed out waiting for subtasks: {remaining}")
+            logger.warning("Timed out waiting for subtasks: %s", remaining)
 
         return results
 
@@ -212,14 +232,17 @@ class ManagerAgent(BaseAgent):
         analysis_data = []
         written_content = []
 
-        for task_id, result in results.items():
-            if isinstance(result, dict):
-                if "research" in str(result).lower():
-                    research_data.append(result)
-                elif "analysis" in str(result).lower() or "insights" in str(result).lower():
-                    analysis_data.append(result)
-                elif "content" in str(result).lower():
-                    written_content.append(result)
+        for result in results.values():
+            if not isinstance(result, dict):
+                continue
+
+            # Classify by result shape rather than stringifying the payload
+            if "research" in result.get("agent", ""):
+                research_data.append(result)
+            elif "insights" in result or "patterns" in result:
+                analysis_data.append(result)
+            elif "content" in result:
+                written_content.append(result)
 
         if research_data:
             synthesized["research"] = research_data
@@ -1,8 +1,10 @@
 """Research agent - Gathers and verifies information from multiple sources."""
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agents.base_agent import BaseAgent
 from communication.message_bus import MessageBus
@@ -10,6 +12,25 @@ from communication.message_bus import MessageBus
 logger = logging.getLogger(__name__)
 
 
+def _content_signature(source: Optional[str], data: Any) -> Tuple[Optional[str], str]:
+    """
+    Build a (source, content hash) signature for a search result.
+
+    Args:
+        source: Result source
+        data: Result data
+
+    Returns:
+        Signature tuple
+    """
+    try:
+        serialized = json.dumps(data, sort_keys=True, default=str)
+    except TypeError:  # Keys that can't be sorted
+        serialized = repr(data)
+    digest = hashlib.blake2b(serialized.encode(), digest_size=8).hexdigest()
+    return source, digest
+
+
 class ResearchAgent(BaseAgent):
     """
     Research agent that gathers and verifies information.
@@ -18,6 +39,12 @@ class ResearchAgent(BaseAgent):
     and providing confidence scores.
     """
 
+    # Connection pool size for the shared HTTP session
+    HTTP_POOL_LIMIT = 64
+
+    # Maximum number of searches in flight at once
+    MAX_CONCURRENT_SEARCHES = 32
+
     def __init__(self, message_bus: MessageBus, agent_id: str = "research_agent"):
         """
         Initialize research agent.
@@ -32,6 +59,38 @@ class ResearchAgent(BaseAgent):
             capabilities=["research", "information_gathering", "verification"]
         )
         self.knowledge_base: Dict[str, Any] = {}
+        self._kb_lower_keys: Dict[str, str] = {}  # key -> key.lower()
+        self._http = None  # aiohttp.ClientSession, opened on first use
+        self._search_slots = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+
+    def _get_http(self):
+        """
+        Get the pooled HTTP session, opening it on first use.
+
+        aiohttp is an optional dependency (the ``http`` extra) and is only
+        imported once a search actually needs it.
+
+        Returns:
+            Shared aiohttp.ClientSession
+        """
+        if self._http is None:
+            import aiohttp
+
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.HTTP_POOL_LIMIT,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+            )
+        return self._http
+
+    async def stop(self) -> None:
+        """Stop the agent and close its HTTP session, if one was opened."""
+        await super().stop()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
 
     async def process_task(self, task_data: Dict[str, Any]) -> Any:
         """
@@ -47,7 +106,14 @@ class ResearchAgent(BaseAgent):
         parameters = task_data.get("parameters", {})
         query = parameters.get("query", description)
 
-        logger.info(f"Research agent processing: {query}")
+        logger.info("Research agent processing: %s", query)
+
+        # Repeated queries are answered from the result cache
+        cache_key = query.strip().lower()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            cached["query"] = query  # Echo this caller's text, not the cached one
+            return cached
 
         # Perform multi-source search
         results = await self._multi_source_search(query)
@@ -58,13 +124,16 @@ class ResearchAgent(BaseAgent):
         # Calculate confidence
         confidence = self._calculate_confidence(verified_results)
 
-        return {
+        result = {
             "query": query,
             "results": verified_results,
             "confidence": confidence,
             "sources": len(results),
             "agent": self.agent_id
         }
+        self._cache_put(cache_key, result)
+
+        return result
 
     async def _multi_source_search(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -89,23 +158,24 @@ class ResearchAgent(BaseAgent):
                 "reliability": 0.9
             })
 
-        # Simulate web search
-        web_results = await self._simulate_web_search(query)
+        # Web and academic searches are independent, so run them concurrently
+        web_results, academic_results = await asyncio.gather(
+            self._simulate_web_search(query),
+            self._simulate_academic_search(query)
+        )
+
         results.append({
             "source": "web_search",
             "data": web_results,
             "reliability": 0.7
         })
-
-        # Simulate academic database
-        academic_results = await self._simulate_academic_search(query)
         results.append({
             "source": "academic",
             "data": academic_results,
             "reliability": 0.95
         })
 
-        logger.info(f"Found {len(results)} sources for query: {query}")
+        logger.info("Found %d sources for query: %s", len(results), query)
         return results
 
     def _search_knowledge_base(self, query: str) -> Optional[Dict[str, Any]]:
@@ -120,22 +190,26 @@ class ResearchAgent(BaseAgent):
         """
         # Simple keyword matching in knowledge base
         query_lower = query.lower()
-        for key, value in self.knowledge_base.items():
-            if key.lower() in query_lower or query_lower in key.lower():
-                return value
+        for key, key_lower in self._kb_lower_keys.items():
+            if key_lower in query_lower or query_lower in key_lower:
+                return self.knowledge_base[key]
         return None
 
     async def _simulate_web_search(self, query: str) -> Dict[str, Any]:
         """
         Simulate web search.
 
+        A real implementation should issue its requests through self._get_http()
+        so connections are pooled across searches.
+
         Args:
             query: Search query
 
         Returns:
             Simulated web search results
         """
-        await asyncio.sleep(0.1)  # Simulate network delay
+        async with self._search_slots:
+            await asyncio.sleep(0.1)  # Simulate network delay
 
         # Return simulated results based on query
         return {
@@ -152,13 +226,17 @@ class ResearchAgent(BaseAgent):
         """
         Simulate academic database search.
 
+        A real implementation should issue its requests through self._get_http()
+        so connections are pooled across searches.
+
         Args:
             query: Search query
 
         Returns:
             Simulated academic search results
         """
-        await asyncio.sleep(0.15)  # Simulate database query delay
+        async with self._search_slots:
+            await asyncio.sleep(0.15)  # Simulate database query delay
 
         return {
             "papers_found": 5,
@@ -186,23 +264,34 @@ class ResearchAgent(BaseAgent):
             "reliability_score": 0.0
         }
 
-        total_reliability = 0.0
-        all_data = []
-
+        # Keep the most reliable copy of each (source, content) pair
+        by_signature: Dict[Tuple[Optional[str], str], Dict[str, Any]] = {}
         for result in results:
-            source = result.get("source")
-            data = result.get("data", {})
-            reliability = result.get("reliability", 0.5)
-
-            total_reliability += reliability
-            all_data.append({
-                "source": source,
-                "data": data,
-                "reliability": reliability
-            })
+            entry = {
+                "source": result.get("source"),
+                "data": result.get("data", {}),
+                "reliability": result.get("reliability", 0.5)
+            }
+            signature = _content_signature(entry["source"], entry["data"])
+            current = by_signature.get(signature)
+            if current is None or entry["reliability"] > current["reliability"]:
+                by_signature[signature] = entry
+
+        # Collapse entries repeating the same summary, whatever their source
+        consolidated: Dict[Any, Dict[str, Any]] = {}
+        for signature, entry in by_signature.items():
+            data = entry["data"]
+            summary = data.get("summary") if isinstance(data, dict) else None
+            key = ("summary", summary) if isinstance(summary, str) else signature
+            current = consolidated.get(key)
+            if current is None or entry["reliability"] > current["reliability"]:
+                consolidated[key] = entry
+
+        all_data = list(consolidated.values())
+        total_reliability = sum(entry["reliability"] for entry in all_data)
 
         verified["consolidated_data"] = all_data
-        verified["reliability_score"] = total_reliability / len(results) if results else 0.0
+        verified["reliability_score"] = total_reliability / len(all_data) if all_data else 0.0
 
         return verified
 
@@ -234,7 +323,10 @@ class ResearchAgent(BaseAgent):
             data: Knowledge data
         """
         self.knowledge_base[key] = data
-        logger.info(f"Added to knowledge base: {key}")
+        self._kb_lower_keys[key] = key.lower()
+        # Cached results may not reflect the new knowledge
+        self._result_cache.clear()
+        logger.info("Added to knowledge base: %s", key)
 
     async def verify_information(self, claim: str) -> Dict[str, Any]:
         """
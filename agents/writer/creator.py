@@ -20,6 +20,22 @@ class WriterAgent(BaseAgent):
     and adapting to different writing styles.
     """
 
+    # Section templates by style; None is the fallback for other styles
+    _INTRO_TEMPLATES = {
+        "formal": "# {topic}\n\nThis document provides a comprehensive overview of {topic}. The following sections explore key aspects, research findings, and analytical insights.",
+        "casual": "# {topic}\n\nLet's dive into {topic}! We'll explore what makes this interesting and what we've learned.",
+        None: "# {topic}\n\nAn exploration of {topic} and its implications."
+    }
+
+    _CONCLUSION_TEMPLATES = {
+        "formal": "## Conclusion\n\nIn summary, this analysis of {topic} provides valuable insights supported by research and data analysis. The findings contribute to our understanding and inform future directions.",
+        "casual": "## Wrapping Up\n\nThat's our look at {topic}! We've covered the key points and what they mean.",
+        None: "## Conclusion\n\nThis overview of {topic} synthesizes research and analysis to provide a comprehensive perspective."
+    }
+
+    # Maximum number of distinct insights rendered in the analysis section
+    MAX_INSIGHTS = 10
+
     def __init__(self, message_bus: MessageBus, agent_id: str = "writer_agent"):
         """
         Initialize writer agent.
@@ -52,8 +68,16 @@ class WriterAgent(BaseAgent):
         style = parameters.get("style", "formal")
         content_type = parameters.get("content_type", "article")
         needs_research = parameters.get("needs_research", True)
+        needs_analysis = parameters.get("needs_analysis", False)
+
+        logger.info("Writer agent creating %s on: %s", content_type, topic)
 
-        logger.info(f"Writer agent creating {content_type} on: {topic}")
+        # Repeated requests are answered from the result cache; the topic is
+        # rendered verbatim, so it is keyed case-sensitively
+        cache_key = (topic, style, content_type, needs_research, needs_analysis)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         # Request research if needed
         research_data = None
@@ -62,7 +86,7 @@ class WriterAgent(BaseAgent):
 
         # Request analysis if available
         analysis_data = None
-        if research_data and parameters.get("needs_analysis", False):
+        if research_data and needs_analysis:
             analysis_data = await self._request_analysis(research_data)
 
         # Generate content
@@ -74,7 +98,7 @@ class WriterAgent(BaseAgent):
             analysis_data=analysis_data
         )
 
-        return {
+        result = {
             "content": content,
             "topic": topic,
             "content_type": content_type,
@@ -82,6 +106,12 @@ class WriterAgent(BaseAgent):
             "word_count": len(content.split()),
             "agent": self.agent_id
         }
+        # Don't cache content written without data we asked for
+        if ((research_data is not None or not needs_research)
+                and (analysis_data is not None or not needs_analysis)):
+            self._cache_put(cache_key, result)
+
+        return result
 
     async def _request_research(self, topic: str) -> Optional[Dict[str, Any]]:
         """
@@ -94,7 +124,7 @@ class WriterAgent(BaseAgent):
             Research results
         """
         request_id = str(uuid4())
-        logger.info(f"Requesting research on: {topic}")
+        logger.info("Requesting research on: %s", topic)
 
         message_content = {
             "task_id": request_id,
@@ -102,6 +132,7 @@ class WriterAgent(BaseAgent):
             "parameters": {"query": topic}
         }
 
+        self._expect_result(request_id)
         await self.send_message("research_agent", message_content, MessageType.TASK)
 
         # Wait for response
@@ -133,6 +164,7 @@ class WriterAgent(BaseAgent):
             "parameters": {"data": data}
         }
 
+        self._expect_result(request_id)
         await self.send_message("analyzer_agent", message_content, MessageType.TASK)
 
         # Wait for response
@@ -150,27 +182,22 @@ class WriterAgent(BaseAgent):
         Wait for a response message.
 
         Args:
-            request_id: Request ID to wait for
+            request_id: Request ID registered with _expect_result
             timeout: Timeout in seconds
 
         Returns:
             Response message or None
         """
-        start_time = asyncio.get_event_loop().time()
-
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            if not self.inbox.empty():
-                message = await asyncio.wait_for(self.inbox.get(), timeout=0.5)
-                if message.message_type == MessageType.RESULT:
-                    if message.content.get("task_id") == request_id:
-                        return message
-                else:
-                    # Put it back if it's not what we're looking for
-                    await self.inbox.put(message)
+        future = self.pending_futures.get(request_id)
+        if future is None:
+            return None
 
-            await asyncio.sleep(0.1)
-
-        return None
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.pending_futures.pop(request_id, None)
 
     async def _generate(
         self,
@@ -217,16 +244,11 @@ class WriterAgent(BaseAgent):
 
     def _generate_introduction(self, topic: str, style: str) -> str:
         """Generate introduction section."""
-        if style == "formal":
-            return f"# {topic}\n\nThis document provides a comprehensive overview of {topic}. The following sections explore key aspects, research findings, and analytical insights."
-        elif style == "casual":
-            return f"# {topic}\n\nLet's dive into {topic}! We'll explore what makes this interesting and what we've learned."
-        else:
-            return f"# {topic}\n\nAn exploration of {topic} and its implications."
+        return self._INTRO_TEMPLATES.get(style, self._INTRO_TEMPLATES[None]).format(topic=topic)
 
     def _generate_research_section(self, research_data: Dict[str, Any]) -> str:
         """Generate section based on research data."""
-        section = "## Research Findings\n\n"
+        parts = ["## Research Findings\n\n"]
 
         results = research_data.get("results", {})
         confidence = research_data.get("confidence", 0.0)
@@ -234,37 +256,51 @@ class WriterAgent(BaseAgent):
         consolidated = results.get("consolidated_data", [])
 
         if consolidated:
-            section += "Based on multiple sources, the following information was gathered:\n\n"
+            parts.append("Based on multiple sources, the following information was gathered:\n\n")
             for i, source_data in enumerate(consolidated, 1):
                 source = source_data.get("source", "unknown")
-                section += f"- Source {i} ({source}): {source_data.get('data', {}).get('summary', 'Data available')}\n"
+                parts.append(f"- Source {i} ({source}): {source_data.get('data', {}).get('summary', 'Data available')}\n")
 
-        section += f"\n*Research confidence: {confidence * 100:.0f}%*"
+        parts.append(f"\n*Research confidence: {confidence * 100:.0f}%*")
 
-        return section
+        return "".join(parts)
 
     def _generate_analysis_section(self, analysis_data: Dict[str, Any]) -> str:
         """Generate section based on analysis data."""
-        section = "## Analysis & Insights\n\n"
+        parts = ["## Analysis & Insights\n\n"]
 
-        insights = analysis_data.get("insights", [])
+        insights = self._unique_insights(analysis_data.get("insights", []))
         if insights:
-            section += "Key insights from the analysis:\n\n"
-            for insight in insights:
-                section += f"- {insight}\n"
+            parts.append("Key insights from the analysis:\n\n")
+            parts.extend(f"- {insight}\n" for insight in insights)
         else:
-            section += "Analytical processing reveals important patterns and trends in the data."
+            parts.append("Analytical processing reveals important patterns and trends in the data.")
+
+        return "".join(parts)
 
-        return section
+    def _unique_insights(self, insights: List[Any]) -> List[Any]:
+        """
+        Drop repeated insights, keeping the first occurrence of each.
+
+        Insights are compared by their trimmed, lowercased text. At most
+        MAX_INSIGHTS are kept.
+
+        Args:
+            insights: Insights from the analysis
+
+        Returns:
+            Distinct insights in their original order
+        """
+        unique: Dict[str, Any] = {}
+        for insight in insights:
+            unique.setdefault(str(insight).strip().lower(), insight)
+            if len(unique) >= self.MAX_INSIGHTS:
+                break
+        return list(unique.values())
 
     def _generate_conclusion(self, topic: str, style: str) -> str:
         """Generate conclusion section."""
-        if style == "formal":
-            return f"## Conclusion\n\nIn summary, this analysis of {topic} provides valuable insights supported by research and data analysis. The findings contribute to our understanding and inform future directions."
-        elif style == "casual":
-            return f"## Wrapping Up\n\nThat's our look at {topic}! We've covered the key points and what they mean."
-        else:
-            return f"## Conclusion\n\nThis overview of {topic} synthesizes research and analysis to provide a comprehensive perspective."
+        return self._CONCLUSION_TEMPLATES.get(style, self._CONCLUSION_TEMPLATES[None]).format(topic=topic)
 
     async def create_content(
         self,
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
 from .message import Message, MessageType
 from .message_bus import MessageBus
@@ -10,6 +10,9 @@ from .protocol import AgentStatus, Task, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Task statuses that count as active
+_ACTIVE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS})
+
 
 class Coordinator:
     """
@@ -28,7 +31,23 @@ class Coordinator:
         self.message_bus = message_bus
         self.active_tasks: Dict[str, Task] = {}
         self.task_assignments: Dict[str, str] = {}  # task_id -> agent_id
+        self.task_messages: Dict[str, str] = {}  # task_id -> TASK message_id
         self.agent_status: Dict[str, AgentStatus] = {}
+        self._active_ids: Dict[str, None] = {}  # Insertion-ordered set of active task IDs
+
+    def _set_status(self, task: Task, status: TaskStatus) -> None:
+        """
+        Update a task's status and the active-task index.
+
+        Args:
+            task: Task to update
+            status: New status
+        """
+        task.status = status
+        if status in _ACTIVE_STATUSES:
+            self._active_ids[task.task_id] = None
+        else:
+            self._active_ids.pop(task.task_id, None)
 
     async def assign_task(
         self,
@@ -64,8 +83,9 @@ class Coordinator:
         if success:
             self.active_tasks[task.task_id] = task
             self.task_assignments[task.task_id] = agent_id
-            task.status = TaskStatus.IN_PROGRESS
-            logger.info(f"Assigned task {task.task_id} to {agent_id}")
+            self.task_messages[task.task_id] = message.message_id
+            self._set_status(task, TaskStatus.IN_PROGRESS)
+            logger.info("Assigned task %s to %s", task.task_id, agent_id)
 
         return success
 
@@ -84,41 +104,43 @@ class Coordinator:
         Returns:
             Dictionary of task_id -> result
         """
+        async def _wait_one(task_id: str):
+            # Agents reply with the TASK message's ID as correlation_id
+            msg = await self.message_bus.wait_for_message(
+                self.task_assignments[task_id],
+                correlation_id=self.task_messages.get(task_id),
+                timeout=timeout
+            )
+            return task_id, msg
+
         results = {}
-        start_time = asyncio.get_event_loop().time()
-        remaining_tasks = set(task_ids)
-
-        while remaining_tasks and (asyncio.get_event_loop().time() - start_time) < timeout:
-            # Check message history for results
-            for task_id in list(remaining_tasks):
-                if task_id in self.active_tasks:
-                    task = self.active_tasks[task_id]
-                    agent_id = self.task_assignments.get(task_id)
-
-                    if agent_id:
-                        # Look for response from agent
-                        msg = await self.message_bus.wait_for_message(
-                            agent_id,
-                            correlation_id=None,
-                            timeout=0.5
-                        )
-
-                        if msg and msg.message_type == MessageType.RESULT:
-                            content = msg.content
-                            if content.get("task_id") == task_id:
-                                results[task_id] = content.get("result")
-                                task.result = content.get("result")
-                                task.status = TaskStatus.COMPLETED
-                                remaining_tasks.remove(task_id)
-                                logger.info(f"Received result for task {task_id}")
-
-            await asyncio.sleep(0.1)
+        remaining = set(task_ids)
+        waiting = [
+            task_id for task_id in task_ids
+            if task_id in self.active_tasks and task_id in self.task_assignments
+        ]
+
+        # Wait for every task concurrently
+        replies = await asyncio.gather(*(_wait_one(task_id) for task_id in waiting))
+
+        for task_id, msg in replies:
+            if msg and msg.message_type == MessageType.RESULT:
+                task = self.active_tasks[task_id]
+                results[task_id] = msg.content.get("result")
+                task.result = results[task_id]
+                self._set_status(task, TaskStatus.COMPLETED)
+                remaining.discard(task_id)
+                logger.info("Received result for task %s", task_id)
+            elif msg and msg.message_type == MessageType.ERROR:
+                self._set_status(self.active_tasks[task_id], TaskStatus.FAILED)
+                remaining.discard(task_id)
+                logger.warning("Task %s failed: %s", task_id, msg.content.get("error"))
 
         # Mark timed out tasks as failed
-        for task_id in remaining_tasks:
+        for task_id in remaining:
             if task_id in self.active_tasks:
-                self.active_tasks[task_id].status = TaskStatus.FAILED
-                logger.warning(f"Task {task_id} timed out")
+                self._set_status(self.active_tasks[task_id], TaskStatus.FAILED)
+                logger.warning("Task %s timed out", task_id)
 
         return results
 
@@ -137,22 +159,31 @@ class Coordinator:
 
         status_dict = {}
 
-        for agent_id in agent_ids:
-            message = Message(
+        messages = [
+            Message(
                 to=agent_id,
                 from_="coordinator",
                 message_type=MessageType.REQUEST,
                 content={"action": "status"}
             )
+            for agent_id in agent_ids
+        ]
 
-            await self.message_bus.send_message(message)
+        await self.message_bus.send_batch(messages)
 
-        # Wait for responses
-        await asyncio.sleep(0.5)
+        async def _await_status(message: Message):
+            reply = await self.message_bus.wait_for_message(
+                message.to,
+                correlation_id=message.message_id,
+                timeout=1.0
+            )
+            return message.to, reply
+
+        # Wait for all responses concurrently
+        replies = await asyncio.gather(*(_await_status(message) for message in messages))
 
         # Collect status responses
-        for agent_id in agent_ids:
-            msg = await self.message_bus.wait_for_message(agent_id, timeout=1.0)
+        for agent_id, msg in replies:
             if msg and msg.message_type == MessageType.STATUS:
                 status = AgentStatus(
                     agent_id=agent_id,
@@ -183,13 +214,14 @@ class Coordinator:
         """
         Get all active tasks.
 
+        Only tasks made active through the coordinator are indexed; the
+        status check drops any whose status was changed directly.
+
         Returns:
             List of active tasks
         """
-        return [
-            task for task in self.active_tasks.values()
-            if task.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
-        ]
+        tasks = (self.active_tasks[task_id] for task_id in self._active_ids)
+        return [task for task in tasks if task.status in _ACTIVE_STATUSES]
 
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -203,7 +235,7 @@ class Coordinator:
         """
         if task_id in self.active_tasks:
             task = self.active_tasks[task_id]
-            task.status = TaskStatus.CANCELLED
-            logger.info(f"Cancelled task {task_id}")
+            self._set_status(task, TaskStatus.CANCELLED)
+            logger.info("Cancelled task %s", task_id)
             return True
         return False
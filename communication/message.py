@@ -1,5 +1,7 @@
 """Message definitions for agent communication."""
 
+import copy
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -7,8 +9,14 @@ from typing import Any, Optional
 from uuid import uuid4
 
 
-class MessageType(Enum):
-    """Types of messages that can be sent between agents."""
+class MessageType(str, Enum):
+    """
+    Types of messages that can be sent between agents.
+
+    Mixes in str so members hash and compare as their string values,
+    which keeps dict-based dispatch on message type cheap. str() and
+    formatting also give the value, so members log without .value.
+    """
 
     TASK = "task"
     RESULT = "result"
@@ -18,8 +26,10 @@ class MessageType(Enum):
     STATUS = "status"
     ERROR = "error"
 
+    __str__ = str.__str__
+
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     Message structure for inter-agent communication.
@@ -30,7 +40,7 @@ class Message:
         message_type: Type of message
         content: Message payload
         correlation_id: ID for tracking related messages
-        timestamp: When message was created
+        timestamp: When message was created (seconds since the epoch)
         metadata: Additional message metadata
     """
 
@@ -38,11 +48,16 @@ class Message:
     from_: str
     message_type: MessageType
     content: Any
-    message_id: str = field(default_factory=lambda: str(uuid4()))
+    message_id: str = field(default_factory=lambda: uuid4().hex)
     correlation_id: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)
     metadata: dict = field(default_factory=dict)
 
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp)
+
     def reply(self, content: Any, message_type: MessageType = MessageType.RESPONSE) -> "Message":
         """
         Create a reply message.
@@ -62,9 +77,26 @@ class Message:
             correlation_id=self.message_id
         )
 
+    def clone_for(self, to: str) -> "Message":
+        """
+        Copy this message for another recipient.
+
+        The copy is shallow: message_id, timestamp, content and metadata
+        are shared with this message, not duplicated.
+
+        Args:
+            to: Recipient of the copy
+
+        Returns:
+            New message addressed to the recipient
+        """
+        clone = copy.copy(self)
+        clone.to = to
+        return clone
+
     def __repr__(self) -> str:
         return (
             f"Message(id={self.message_id[:8]}..., "
             f"from={self.from_}, to={self.to}, "
-            f"type={self.message_type.value})"
+            f"type={self.message_type})"
         )
@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from collections import defaultdict, deque
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from .message import Message, MessageType
 
@@ -18,26 +19,50 @@ class MessageBus:
     broadcasting, and communication logging.
     """
 
-    def __init__(self):
-        """Initialize the message bus."""
+    def __init__(self, history_size: int = 10_000):
+        """
+        Initialize the message bus.
+
+        Args:
+            history_size: Maximum number of messages kept in the history;
+                the oldest are dropped first
+        """
         self.agents: Dict[str, asyncio.Queue] = {}
-        self.message_history: List[Message] = []
+        self.history_size = history_size
+        self.message_history: Deque[Message] = deque(maxlen=history_size)
+        # agent_id -> recent messages sent or received by that agent
+        self._by_agent: Dict[str, Deque[Message]] = defaultdict(
+            lambda: deque(maxlen=self.history_size)
+        )
+        self._result_handlers: Dict[str, Callable[[Message], bool]] = {}
+        # (sender, correlation_id or None) -> futures in wait_for_message
+        self._waiters: Dict[Tuple[str, Optional[str]], List[asyncio.Future]] = defaultdict(list)
         self.running = False
-        self._lock = asyncio.Lock()
 
-    async def register_agent(self, agent_id: str, inbox: asyncio.Queue) -> None:
+    async def register_agent(
+        self,
+        agent_id: str,
+        inbox: asyncio.Queue,
+        result_handler: Optional[Callable[[Message], bool]] = None
+    ) -> None:
         """
         Register an agent with the message bus.
 
         Args:
             agent_id: Unique identifier for the agent
             inbox: Agent's inbox queue for receiving messages
+            result_handler: Optional in-process callback offered RESULT
+                messages before they are queued; returns True if it
+                consumed the message
         """
-        async with self._lock:
-            if agent_id in self.agents:
-                logger.warning(f"Agent {agent_id} already registered, updating inbox")
-            self.agents[agent_id] = inbox
-            logger.info(f"Registered agent: {agent_id}")
+        if agent_id in self.agents:
+            logger.warning("Agent %s already registered, updating inbox", agent_id)
+        self.agents[agent_id] = inbox
+        if result_handler is not None:
+            self._result_handlers[agent_id] = result_handler
+        else:
+            self._result_handlers.pop(agent_id, None)
+        logger.info("Registered agent: %s", agent_id)
 
     async def unregister_agent(self, agent_id: str) -> None:
         """
@@ -46,10 +71,10 @@ class MessageBus:
         Args:
             agent_id: Agent to unregister
         """
-        async with self._lock:
-            if agent_id in self.agents:
-                del self.agents[agent_id]
-                logger.info(f"Unregistered agent: {agent_id}")
+        if agent_id in self.agents:
+            del self.agents[agent_id]
+            self._result_handlers.pop(agent_id, None)
+            logger.info("Unregistered agent: %s", agent_id)
 
     async def send_message(self, message: Message) -> bool:
         """
@@ -61,20 +86,117 @@ class MessageBus:
         Returns:
             True if message was delivered, False otherwise
         """
-        async with self._lock:
-            if message.to not in self.agents:
-                logger.error(f"Agent {message.to} not found")
-                return False
+        inbox = self.agents.get(message.to)
+        if inbox is None:
+            logger.error("Agent %s not found", message.to)
+            return False
+
+        if not self._deliver_result(message) and not self._enqueue(inbox, message):
+            return False
+        self._record(message)
+
+        logger.debug(
+            "Message sent: %s -> %s (%s)",
+            message.from_, message.to, message.message_type
+        )
+        return True
+
+    async def send_batch(self, messages: List[Message]) -> int:
+        """
+        Send several messages in one pass.
+
+        Unknown recipients are logged and skipped without stopping the
+        rest of the batch.
+
+        Args:
+            messages: Messages to send
+
+        Returns:
+            Number of messages delivered
+        """
+        delivered = []
+
+        for message in messages:
+            inbox = self.agents.get(message.to)
+            if inbox is None:
+                logger.error("Agent %s not found", message.to)
+                continue
+            if not self._deliver_result(message) and not self._enqueue(inbox, message):
+                continue
+            delivered.append(message)
+
+        for message in delivered:
+            self._record(message)
+
+        logger.debug("Batch sent: %d of %d messages delivered", len(delivered), len(messages))
+        return len(delivered)
+
+    @staticmethod
+    def _enqueue(inbox: asyncio.Queue, message: Message) -> bool:
+        """
+        Put a message on an inbox without waiting.
+
+        Inboxes are unbounded by default, so put() would never suspend and
+        only add a trip through the event loop.
+
+        Args:
+            inbox: Recipient inbox
+            message: Message to deliver
+
+        Returns:
+            True if queued, False if the inbox is full
+        """
+        try:
+            inbox.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.error("Inbox of %s is full, dropping message", message.to)
+            return False
+        return True
+
+    def _record(self, message: Message) -> None:
+        """
+        Record a sent message in the history and wake matching waiters.
+
+        Args:
+            message: Message that was sent
+        """
+        self.message_history.append(message)
+        self._by_agent[message.from_].append(message)
+        if message.to != message.from_:
+            self._by_agent[message.to].append(message)
+        self._notify_waiters(message)
+
+    def _notify_waiters(self, message: Message) -> None:
+        """
+        Wake wait_for_message calls matching a sent message.
+
+        Args:
+            message: Message just recorded in the history
+        """
+        if not self._waiters:
+            return
+        for key in ((message.from_, message.correlation_id), (message.from_, None)):
+            for future in self._waiters.pop(key, ()):
+                if not future.done():
+                    future.set_result(message)
+
+    def _deliver_result(self, message: Message) -> bool:
+        """
+        Hand a RESULT straight to the recipient's result handler.
+
+        Skips the inbox round trip for replies an in-process agent is
+        already waiting on.
 
-            inbox = self.agents[message.to]
-            await inbox.put(message)
-            self.message_history.append(message)
+        Args:
+            message: Message being sent
 
-            logger.debug(
-                f"Message sent: {message.from_} -> {message.to} "
-                f"({message.message_type.value})"
-            )
-            return True
+        Returns:
+            True if the handler consumed the message
+        """
+        if message.message_type != MessageType.RESULT:
+            return False
+        handler = self._result_handlers.get(message.to)
+        return handler is not None and handler(message)
 
     async def broadcast(self, message: Message, exclude: Optional[Set[str]] = None) -> int:
         """
@@ -90,21 +212,23 @@ class MessageBus:
         exclude = exclude or set()
         count = 0
 
-        async with self._lock:
-            for agent_id, inbox in self.agents.items():
-                if agent_id not in exclude and agent_id != message.from_:
-                    broadcast_msg = Message(
-                        to=agent_id,
-                        from_=message.from_,
-                        message_type=MessageType.BROADCAST,
-                        content=message.content,
-                        metadata=message.metadata
-                    )
-                    await inbox.put(broadcast_msg)
-                    count += 1
-
-            self.message_history.append(message)
-            logger.debug(f"Broadcast from {message.from_} to {count} agents")
+        # Resolve recipients up front so registry changes can't affect delivery
+        recipients = tuple(
+            (agent_id, inbox) for agent_id, inbox in self.agents.items()
+            if agent_id not in exclude and agent_id != message.from_
+        )
+
+        # Copies share the original's ID and timestamp, so replies correlate
+        # with the recorded broadcast
+        for agent_id, inbox in recipients:
+            broadcast_msg = message.clone_for(agent_id)
+            broadcast_msg.message_type = MessageType.BROADCAST
+            broadcast_msg.correlation_id = None
+            if self._enqueue(inbox, broadcast_msg):
+                count += 1
+
+        self._record(message)
+        logger.debug("Broadcast from %s to %d agents", message.from_, count)
 
         return count
 
@@ -117,24 +241,22 @@ class MessageBus:
         Get message history.
 
         Args:
-            agent_id: Filter by agent ID (sender or receiver)
+            agent_id: Filter by agent ID (sender or receiver); each agent
+                keeps its own last history_size messages
             limit: Maximum number of messages to return
 
         Returns:
             List of messages
         """
-        history = self.message_history
-
         if agent_id:
-            history = [
-                msg for msg in history
-                if msg.from_ == agent_id or msg.to == agent_id
-            ]
+            history = self._by_agent.get(agent_id, ())
+        else:
+            history = self.message_history
 
         if limit:
-            history = history[-limit:]
+            return list(islice(history, max(0, len(history) - limit), None))
 
-        return history
+        return list(history)
 
     def get_registered_agents(self) -> List[str]:
         """
@@ -154,6 +276,9 @@ class MessageBus:
         """
         Wait for a specific message.
 
+        Returns the latest matching message already sent, otherwise waits
+        for the next one.
+
         Args:
             agent_id: Agent to wait for message from
             correlation_id: Correlation ID to match
@@ -162,18 +287,28 @@ class MessageBus:
         Returns:
             Message if received, None if timeout
         """
-        start_time = asyncio.get_event_loop().time()
-
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            for msg in reversed(self.message_history):
-                if msg.from_ == agent_id:
-                    if correlation_id is None or msg.correlation_id == correlation_id:
-                        return msg
-            await asyncio.sleep(0.1)
-
-        return None
+        for msg in reversed(self._by_agent.get(agent_id, ())):
+            if msg.from_ == agent_id:
+                if correlation_id is None or msg.correlation_id == correlation_id:
+                    return msg
+
+        key = (agent_id, correlation_id)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[key].append(future)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[key]
 
     def clear_history(self) -> None:
         """Clear message history."""
         self.message_history.clear()
+        self._by_agent.clear()
         logger.info("Message history cleared")
@@ -1,12 +1,25 @@
 """Communication protocols for agent interactions."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+# Payload "action" values
+_TASK_REQUEST_ACTION = "task_request"
+_TASK_RESPONSE_ACTION = "task_response"
+_STATUS_REQUEST_ACTION = "status_request"
+_STATUS_RESPONSE_ACTION = "status_response"
+_DATA_REQUEST_ACTION = "data_request"
+_DATA_RESPONSE_ACTION = "data_response"
 
-class TaskStatus(Enum):
-    """Status of a task."""
+
+class TaskStatus(str, Enum):
+    """
+    Status of a task.
+
+    Mixes in str, like MessageType, so members compare equal to and
+    serialize as their string values.
+    """
 
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -15,8 +28,13 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class AgentCapability(Enum):
-    """Capabilities that agents can have."""
+class AgentCapability(str, Enum):
+    """
+    Capabilities that agents can have.
+
+    Mixes in str so members compare equal to the capability strings
+    agents advertise.
+    """
 
     RESEARCH = "research"
     WRITING = "writing"
@@ -25,7 +43,7 @@ class AgentCapability(Enum):
     DATA_PROCESSING = "data_processing"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Task representation for agent processing.
@@ -46,16 +64,12 @@ class Task:
     task_type: str
     parameters: Dict[str, Any]
     priority: int = 5
-    required_capabilities: Optional[list] = None
+    required_capabilities: List[str] = field(default_factory=list)
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[Any] = None
 
-    def __post_init__(self):
-        if self.required_capabilities is None:
-            self.required_capabilities = []
 
-
-@dataclass
+@dataclass(slots=True)
 class AgentStatus:
     """
     Agent status information.
@@ -71,13 +85,9 @@ class AgentStatus:
     agent_id: str
     state: str
     current_task: Optional[str] = None
-    capabilities: list = None
+    capabilities: List[str] = field(default_factory=list)
     workload: float = 0.0
 
-    def __post_init__(self):
-        if self.capabilities is None:
-            self.capabilities = []
-
 
 class Protocol:
     """
@@ -98,7 +108,7 @@ class Protocol:
             Task request payload
         """
         return {
-            "action": "task_request",
+            "action": _TASK_REQUEST_ACTION,
             "task": {
                 "task_id": task.task_id,
                 "description": task.description,
@@ -123,7 +133,7 @@ class Protocol:
             Task response payload
         """
         return {
-            "action": "task_response",
+            "action": _TASK_RESPONSE_ACTION,
             "task_id": task_id,
             "result": result,
             "status": status.value
@@ -137,7 +147,7 @@ class Protocol:
         Returns:
             Status request payload
         """
-        return {"action": "status_request"}
+        return {"action": _STATUS_REQUEST_ACTION}
 
     @staticmethod
     def status_response(agent_status: AgentStatus) -> Dict[str, Any]:
@@ -151,7 +161,7 @@ class Protocol:
             Status response payload
         """
         return {
-            "action": "status_response",
+            "action": _STATUS_RESPONSE_ACTION,
             "agent_id": agent_status.agent_id,
             "state": agent_status.state,
             "current_task": agent_status.current_task,
@@ -172,7 +182,7 @@ class Protocol:
             Data request payload
         """
         return {
-            "action": "data_request",
+            "action": _DATA_REQUEST_ACTION,
             "query": query,
             "parameters": parameters or {}
         }
@@ -190,7 +200,7 @@ class Protocol:
             Data response payload
         """
         return {
-            "action": "data_response",
+            "action": _DATA_RESPONSE_ACTION,
             "data": data,
             "confidence": confidence
         }
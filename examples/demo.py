@@ -8,11 +8,11 @@ a manager coordinating research, analysis, and writing agents.
 import asyncio
 import json
 import logging
-import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 from agents.manager.coordinator import ManagerAgent
 from agents.research.gatherer import ResearchAgent
@@ -28,6 +28,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj) -> str:
+    """Pretty-print a result as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
 async def main():
     """Run the demo."""
     logger.info("=" * 60)
@@ -46,10 +55,12 @@ async def main():
 
     # Start all agents
     logger.info("Starting agents...")
-    await manager.start()
-    await research_agent.start()
-    await writer_agent.start()
-    await analyzer_agent.start()
+    await asyncio.gather(
+        manager.start(),
+        research_agent.start(),
+        writer_agent.start(),
+        analyzer_agent.start()
+    )
 
     logger.info(f"Active agents: {message_bus.get_registered_agents()}")
 
@@ -68,7 +79,7 @@ async def main():
         )
 
         logger.info("\nResult:")
-        logger.info(json.dumps(result, indent=2, default=str))
+        logger.info(_dumps(result))
 
         # Example 2: Direct agent interaction
         logger.info("\n" + "=" * 60)
@@ -83,7 +94,7 @@ async def main():
 
         research_result = await research_agent.process_task(research_task)
         logger.info("\nResearch Result:")
-        logger.info(json.dumps(research_result, indent=2, default=str))
+        logger.info(_dumps(research_result))
 
         # Example 3: Analysis task
         logger.info("\n" + "=" * 60)
@@ -98,7 +109,7 @@ async def main():
 
         analysis_result = await analyzer_agent.process_task(analysis_task)
         logger.info("\nAnalysis Result:")
-        logger.info(json.dumps(analysis_result, indent=2, default=str))
+        logger.info(_dumps(analysis_result))
 
         # Show message history
         logger.info("\n" + "=" * 60)
@@ -110,16 +121,20 @@ async def main():
         logger.info(f"Recent messages: {len(history)}")
 
         for msg in history[-5:]:
-            logger.info(f"  {msg.from_} -> {msg.to}: {msg.message_type.value}")
+            logger.info(f"  {msg.from_} -> {msg.to}: {msg.message_type}")
 
     finally:
         # Stop all agents
         logger.info("\n" + "=" * 60)
         logger.info("Shutting down agents...")
-        await manager.stop()
-        await research_agent.stop()
-        await writer_agent.stop()
-        await analyzer_agent.stop()
+        # Stop everything even if one agent fails to shut down cleanly
+        await asyncio.gather(
+            manager.stop(),
+            research_agent.stop(),
+            writer_agent.stop(),
+            analyzer_agent.stop(),
+            return_exceptions=True
+        )
         logger.info("Demo complete!")
 
 
@@ -7,7 +7,10 @@ from agents.manager.coordinator import ManagerAgent
 from agents.research.gatherer import ResearchAgent
 from agents.writer.creator import WriterAgent
 from agents.analyzer.insights import AnalyzerAgent
+from communication.coordination import Coordinator
+from communication.message import Message, MessageType
 from communication.message_bus import MessageBus
+from communication.protocol import Task, TaskStatus
 
 
 @pytest.mark.asyncio
@@ -51,6 +54,54 @@ async def test_research_agent_task():
         await agent.stop()
 
 
+@pytest.mark.asyncio
+async def test_research_result_cache():
+    """Test repeated research queries are served from the cache."""
+    bus = MessageBus()
+    agent = ResearchAgent(bus)
+
+    task_data = {
+        "task_id": "test_cache",
+        "description": "Research solar power",
+        "parameters": {"query": "Solar Power"}
+    }
+
+    first = await agent.process_task(task_data)
+    first["confidence"] = -1.0
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    second = await agent.process_task({**task_data, "parameters": {"query": " solar power "}})
+
+    assert loop.time() - start < 0.1
+    assert second["confidence"] >= 0.0
+    assert second["query"] == " solar power "
+    assert agent.knowledge_base == {}  # Only curated entries live there
+
+    agent.add_to_knowledge_base("solar", {"summary": "Photovoltaics"})
+    third = await agent.process_task(task_data)
+    assert third["sources"] == 3
+
+
+@pytest.mark.asyncio
+async def test_research_http_session_is_lazy():
+    """Test the HTTP session is opened on first use and reused until stop."""
+    pytest.importorskip("aiohttp")
+    bus = MessageBus()
+    agent = ResearchAgent(bus)
+
+    await agent.start()
+    await agent.process_task({"description": "Research", "parameters": {"query": "wind"}})
+    assert agent._http is None
+
+    session = agent._get_http()
+    assert agent._get_http() is session
+
+    await agent.stop()
+    assert session.closed
+    assert agent._http is None
+
+
 @pytest.mark.asyncio
 async def test_analyzer_agent_task():
     """Test analyzer agent processing."""
@@ -82,6 +133,41 @@ async def test_analyzer_agent_task():
         await agent.stop()
 
 
+@pytest.mark.asyncio
+async def test_analyzer_visualizations():
+    """Test chart suggestions follow the detected pattern types."""
+    agent = AnalyzerAgent(MessageBus())
+
+    async def chart_types(data):
+        result = await agent.process_task({"description": "Analyze", "parameters": {"data": data}})
+        return [viz["type"] for viz in result["visualizations"]]
+
+    assert await chart_types({"word_count": 120, "title": "Report"}) == ["bar_chart"]
+    assert await chart_types({"title": "Report"}) == ["summary_chart"]
+    assert await chart_types([3, 1, 2]) == ["line_chart", "pie_chart"]
+
+
+@pytest.mark.asyncio
+async def test_analyzer_compiled_stats():
+    """Test the compiled kernel matches the builtins on large numeric lists."""
+    pytest.importorskip("numba")
+    from agents.analyzer import insights
+
+    agent = AnalyzerAgent(MessageBus())
+    size = insights._KERNEL_THRESHOLD * 2
+
+    for data in ([(i * 7) % 101 - 50 for i in range(size)], [i / 4 for i in range(size)]):
+        result = await agent.process_task({
+            "task_id": "compiled_stats",
+            "description": "Analyze numbers",
+            "parameters": {"data": data}
+        })
+
+        stats = result["statistics"]["numeric_stats"]
+        assert stats == {"min": min(data), "max": max(data), "avg": sum(data) / len(data)}
+        assert type(stats["min"]) is type(data[0])
+
+
 @pytest.mark.asyncio
 async def test_writer_agent_task():
     """Test writer agent processing."""
@@ -113,6 +199,56 @@ async def test_writer_agent_task():
         await writer.stop()
 
 
+@pytest.mark.asyncio
+async def test_writer_cache_keeps_topic_case():
+    """Test cached writer results are not reused for a differently cased topic."""
+    writer = WriterAgent(MessageBus())
+
+    for topic in ("python", "Python"):
+        result = await writer.process_task({
+            "task_id": f"case_{topic}",
+            "description": "Write article",
+            "parameters": {"topic": topic, "needs_research": False}
+        })
+
+        assert result["topic"] == topic
+        assert result["content"].startswith(f"# {topic}\n")
+
+
+@pytest.mark.asyncio
+async def test_writer_requests_research():
+    """Test writer waiting on research while handling a task from its inbox."""
+    bus = MessageBus()
+    research = ResearchAgent(bus)
+    writer = WriterAgent(bus)
+    client_inbox = asyncio.Queue()
+
+    await asyncio.gather(research.start(), writer.start())
+    await bus.register_agent("client", client_inbox)
+
+    try:
+        await bus.send_message(Message(
+            to=writer.agent_id,
+            from_="client",
+            message_type=MessageType.TASK,
+            content={
+                "task_id": "test_004",
+                "description": "Write article",
+                "parameters": {"topic": "ocean currents", "needs_research": True}
+            }
+        ))
+
+        reply = await asyncio.wait_for(client_inbox.get(), timeout=5.0)
+
+        assert reply.message_type == MessageType.RESULT
+        assert reply.content["task_id"] == "test_004"
+        assert "Research Findings" in reply.content["result"]["content"]
+        assert not writer.pending_futures
+
+    finally:
+        await asyncio.gather(writer.stop(), research.stop())
+
+
 @pytest.mark.asyncio
 async def test_manager_coordination():
     """Test manager coordinating multiple agents."""
@@ -124,10 +260,7 @@ async def test_manager_coordination():
     analyzer = AnalyzerAgent(bus)
 
     # Start all agents
-    await manager.start()
-    await research.start()
-    await writer.start()
-    await analyzer.start()
+    await asyncio.gather(manager.start(), research.start(), writer.start(), analyzer.start())
 
     try:
         # Manager should decompose and delegate task
@@ -138,12 +271,55 @@ async def test_manager_coordination():
 
         assert result is not None
         assert "subtask_count" in result or "status" in result
+        # Research and analysis subtasks should both report back
+        assert result["subtask_count"] == 2
 
     finally:
-        await manager.stop()
-        await research.stop()
-        await writer.stop()
-        await analyzer.stop()
+        await asyncio.gather(manager.stop(), research.stop(), writer.stop(), analyzer.stop())
+
+
+@pytest.mark.asyncio
+async def test_agent_queues_malformed_result():
+    """Test a RESULT without dict content is queued rather than breaking the sender."""
+    bus = MessageBus()
+    agent = AnalyzerAgent(bus)
+    await bus.register_agent(agent.agent_id, agent.inbox, result_handler=agent._resolve_result)
+
+    delivered = await bus.send_message(Message(
+        to=agent.agent_id,
+        from_="client",
+        message_type=MessageType.RESULT,
+        content="done"
+    ))
+
+    assert delivered
+    assert (await agent.inbox.get()).content == "done"
+
+
+@pytest.mark.asyncio
+async def test_agent_survives_bad_inbox_message():
+    """Test the dispatcher skips a message it can't route and keeps reading."""
+    bus = MessageBus()
+    agent = AnalyzerAgent(bus)
+    client_inbox = asyncio.Queue()
+
+    await agent.start()
+    await bus.register_agent("client", client_inbox)
+
+    try:
+        agent.inbox.put_nowait("not a message")
+        await bus.send_message(Message(
+            to=agent.agent_id,
+            from_="client",
+            message_type=MessageType.TASK,
+            content={"task_id": "after_bad", "description": "Analyze", "parameters": {"data": [1, 2]}}
+        ))
+
+        reply = await asyncio.wait_for(client_inbox.get(), timeout=5.0)
+        assert reply.content["task_id"] == "after_bad"
+
+    finally:
+        await agent.stop()
 
 
 @pytest.mark.asyncio
@@ -166,6 +342,68 @@ async def test_agent_status():
         await agent.stop()
 
 
+@pytest.mark.asyncio
+async def test_coordinator_gathers_status():
+    """Test coordinator collecting status from running agents."""
+    bus = MessageBus()
+    research = ResearchAgent(bus)
+    analyzer = AnalyzerAgent(bus)
+    coordinator = Coordinator(bus)
+
+    await asyncio.gather(research.start(), analyzer.start())
+    await bus.register_agent("coordinator", asyncio.Queue())
+
+    try:
+        statuses = await coordinator.gather_agent_status([research.agent_id, analyzer.agent_id])
+
+        assert set(statuses) == {research.agent_id, analyzer.agent_id}
+        assert statuses[research.agent_id].state == "idle"
+        assert "analysis" in statuses[analyzer.agent_id].capabilities
+
+    finally:
+        await asyncio.gather(research.stop(), analyzer.stop())
+
+
+@pytest.mark.asyncio
+async def test_coordinator_waits_for_results():
+    """Test coordinator assigning tasks and collecting their results."""
+    bus = MessageBus()
+    analyzer = AnalyzerAgent(bus)
+    coordinator = Coordinator(bus)
+
+    await analyzer.start()
+    await bus.register_agent("coordinator", asyncio.Queue())
+
+    try:
+        tasks = [
+            Task(
+                task_id=f"coord_{i}",
+                description=f"Analyze batch {i}",
+                task_type="analysis",
+                parameters={"data": [i, i + 1, i + 2]}
+            )
+            for i in range(3)
+        ]
+        for task in tasks:
+            assert await coordinator.assign_task(task, analyzer.agent_id)
+        assert coordinator.get_active_tasks() == tasks
+
+        # Status set directly on a task, bypassing the coordinator
+        tasks[0].status = TaskStatus.COMPLETED
+        assert coordinator.get_active_tasks() == tasks[1:]
+        tasks[0].status = TaskStatus.IN_PROGRESS
+
+        results = await coordinator.wait_for_results([task.task_id for task in tasks], timeout=5.0)
+
+        assert set(results) == {task.task_id for task in tasks}
+        assert all(task.status == TaskStatus.COMPLETED for task in tasks)
+        assert coordinator.get_active_tasks() == []
+        assert results["coord_2"]["statistics"]["numeric_stats"]["min"] == 2
+
+    finally:
+        await analyzer.stop()
+
+
 @pytest.mark.asyncio
 async def test_multiple_concurrent_tasks():
     """Test handling multiple concurrent tasks."""
@@ -195,3 +433,42 @@ async def test_multiple_concurrent_tasks():
 
     finally:
         await agent.stop()
+
+
+@pytest.mark.asyncio
+async def test_analyzer_history_bounded(monkeypatch):
+    """Test analyzer history keeps only the most recent summaries."""
+    monkeypatch.setattr(AnalyzerAgent, "HISTORY_MAX", 3)
+    bus = MessageBus()
+    agent = AnalyzerAgent(bus)
+
+    for i in range(5):
+        await agent.process_task({
+            "task_id": f"history_{i}",
+            "description": f"Analyze batch {i}",
+            "parameters": {"data": [i, i + 1]}
+        })
+
+    history = agent.get_analysis_history()
+    assert [entry["task"] for entry in history] == [
+        "Analyze batch 2", "Analyze batch 3", "Analyze batch 4"
+    ]
+    assert "result" not in history[0]
+
+    recent = agent.get_analysis_history(limit=2)
+    assert [entry["task"] for entry in recent] == ["Analyze batch 3", "Analyze batch 4"]
+
+
+def test_writer_deduplicates_insights(monkeypatch):
+    """Test writer renders each insight once, up to the cap."""
+    monkeypatch.setattr(WriterAgent, "MAX_INSIGHTS", 2)
+    writer = WriterAgent(MessageBus())
+
+    section = writer._generate_analysis_section({
+        "insights": ["Trend up", " trend up ", "Outlier found", "Seasonal cycle"]
+    })
+
+    assert section.count("- ") == 2
+    assert "- Trend up\n" in section
+    assert "- Outlier found\n" in section
+    assert "Seasonal cycle" not in section
@@ -1,10 +1,12 @@
 """Tests for communication layer."""
 
 import asyncio
+import json
 import pytest
 
 from communication.message import Message, MessageType
 from communication.message_bus import MessageBus
+from communication.protocol import Protocol, TaskStatus
 
 
 @pytest.mark.asyncio
@@ -22,6 +24,8 @@ async def test_message_creation():
     assert msg.message_type == MessageType.TASK
     assert msg.content == {"data": "test"}
     assert msg.message_id is not None
+    assert str(msg.message_type) == "task"
+    assert "type=task" in repr(msg)
 
 
 @pytest.mark.asyncio
@@ -42,6 +46,26 @@ async def test_message_reply():
     assert reply.content == {"result": "done"}
 
 
+def test_message_clone_for():
+    """Test cloning a message for another recipient."""
+    msg = Message(
+        to="all",
+        from_="agent_1",
+        message_type=MessageType.BROADCAST,
+        content={"data": "test"},
+        correlation_id="req_1"
+    )
+
+    clone = msg.clone_for("agent_2")
+
+    assert clone.to == "agent_2"
+    assert msg.to == "all"
+    assert clone.message_id == msg.message_id
+    assert clone.timestamp == msg.timestamp
+    assert clone.correlation_id == "req_1"
+    assert clone.content is msg.content
+
+
 @pytest.mark.asyncio
 async def test_message_bus_registration():
     """Test agent registration with message bus."""
@@ -76,6 +100,100 @@ async def test_message_bus_send():
     assert received.content == {"task": "test"}
 
 
+@pytest.mark.asyncio
+async def test_message_bus_full_inbox():
+    """Test messages to a full inbox are reported as undelivered."""
+    bus = MessageBus()
+    inbox = asyncio.Queue(maxsize=1)
+
+    await bus.register_agent("agent_1", inbox)
+
+    msg = Message(to="agent_1", from_="agent_2", message_type=MessageType.TASK, content={})
+
+    assert await bus.send_message(msg)
+    assert not await bus.send_message(msg)
+    assert inbox.qsize() == 1
+    assert len(bus.get_history()) == 1
+
+
+@pytest.mark.asyncio
+async def test_message_bus_send_batch():
+    """Test sending a batch of messages through message bus."""
+    bus = MessageBus()
+    inbox = asyncio.Queue()
+
+    await bus.register_agent("agent_1", inbox)
+
+    messages = [
+        Message(to="agent_1", from_="agent_2", message_type=MessageType.TASK, content={"n": 1}),
+        Message(to="missing", from_="agent_2", message_type=MessageType.TASK, content={"n": 2}),
+        Message(to="agent_1", from_="agent_2", message_type=MessageType.TASK, content={"n": 3}),
+    ]
+
+    delivered = await bus.send_batch(messages)
+    assert delivered == 2
+
+    assert (await inbox.get()).content == {"n": 1}
+    assert (await inbox.get()).content == {"n": 3}
+    assert len(bus.get_history()) == 2
+
+
+@pytest.mark.asyncio
+async def test_message_bus_result_handler():
+    """Test RESULT messages go to the result handler when it accepts them."""
+    bus = MessageBus()
+    inbox = asyncio.Queue()
+    handled = []
+
+    def result_handler(message):
+        if message.content.get("task_id") != "awaited":
+            return False
+        handled.append(message)
+        return True
+
+    await bus.register_agent("agent_1", inbox, result_handler=result_handler)
+
+    for task_id in ("awaited", "other"):
+        await bus.send_message(Message(
+            to="agent_1",
+            from_="agent_2",
+            message_type=MessageType.RESULT,
+            content={"task_id": task_id}
+        ))
+
+    assert [msg.content["task_id"] for msg in handled] == ["awaited"]
+    assert inbox.qsize() == 1
+    assert (await inbox.get()).content["task_id"] == "other"
+    assert len(bus.get_history()) == 2
+
+
+@pytest.mark.asyncio
+async def test_message_bus_wait_for_message():
+    """Test waiting for a message that has not been sent yet."""
+    bus = MessageBus()
+    await bus.register_agent("agent_1", asyncio.Queue())
+
+    waiter = asyncio.create_task(
+        bus.wait_for_message("agent_2", correlation_id="req_1", timeout=1.0)
+    )
+    await asyncio.sleep(0)
+
+    for correlation_id in ("other", "req_1"):
+        await bus.send_message(Message(
+            to="agent_1",
+            from_="agent_2",
+            message_type=MessageType.STATUS,
+            content={},
+            correlation_id=correlation_id
+        ))
+
+    reply = await waiter
+    assert reply.correlation_id == "req_1"
+
+    assert await bus.wait_for_message("agent_3", timeout=0.01) is None
+    assert not bus._waiters
+
+
 @pytest.mark.asyncio
 async def test_message_bus_broadcast():
     """Test broadcasting messages."""
@@ -102,6 +220,9 @@ async def test_message_bus_broadcast():
 
     assert msg1.content == {"announcement": "test"}
     assert msg2.content == {"announcement": "test"}
+    assert (msg1.to, msg2.to) == ("agent_1", "agent_2")
+    assert msg1.message_id == msg2.message_id == msg.message_id
+    assert msg.to == "all"  # The recorded original is not readdressed
 
 
 @pytest.mark.asyncio
@@ -127,6 +248,25 @@ async def test_message_history():
     assert agent2_history[0].from_ == "agent_2"
 
 
+@pytest.mark.asyncio
+async def test_message_history_bounded():
+    """Test history keeps only the most recent messages."""
+    bus = MessageBus(history_size=3)
+    await bus.register_agent("agent_1", asyncio.Queue())
+
+    for i in range(5):
+        await bus.send_message(
+            Message(to="agent_1", from_="agent_2", message_type=MessageType.TASK, content={"n": i})
+        )
+
+    assert [msg.content["n"] for msg in bus.get_history()] == [2, 3, 4]
+    assert [msg.content["n"] for msg in bus.get_history(limit=2)] == [3, 4]
+    assert [msg.content["n"] for msg in bus.get_history(agent_id="agent_1", limit=1)] == [4]
+
+    bus.clear_history()
+    assert bus.get_history(agent_id="agent_1") == []
+
+
 @pytest.mark.asyncio
 async def test_message_bus_unregister():
     """Test agent unregistration."""
@@ -138,3 +278,16 @@ async def test_message_bus_unregister():
 
     await bus.unregister_agent("agent_1")
     assert "agent_1" not in bus.get_registered_agents()
+
+
+def test_protocol_payloads():
+    """Test protocol payloads."""
+    response = Protocol.task_response("task_1", {"ok": True}, TaskStatus.COMPLETED)
+    assert response == {
+        "action": "task_response",
+        "task_id": "task_1",
+        "result": {"ok": True},
+        "status": "completed"
+    }
+
+    assert json.loads(json.dumps(Protocol.status_request())) == {"action": "status_request"}